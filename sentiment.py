@@ -2,12 +2,39 @@
 # ©2025 umogal
 import argparse
 import sys
+import os
 import json
 import logging
 import time # For potential performance tracking, though TextBlob's speed is inherent
+import atexit
+import collections
+import copy
+import functools
+import importlib
+import itertools
+import mmap
+import multiprocessing
+import re
 
-from textblob import TextBlob
-from textblob.exceptions import TextBlobException, TranslatorError, NotTranslated
+import numpy as np
+
+# Optional C-accelerated JSON serializer; the standard library is used otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Optional VADER scorer for the "vader" backend.
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer  # type: ignore[import]
+except ImportError:
+    SentimentIntensityAnalyzer = None
+
+# Optional offline language detector; without it --detect-lang falls back to TextBlob.
+try:
+    from lingua import LanguageDetectorBuilder  # type: ignore[import]
+except ImportError:
+    LanguageDetectorBuilder = None
 
 # --- Logging Setup ---
 # Configure a basic logger. Default level is WARNING.
@@ -17,6 +44,549 @@ logging.basicConfig(level=logging.WARNING, stream=sys.stderr,
 # Acquire the logger for this module.
 logger = logging.getLogger(__name__)
 
+# --- Lazy Imports ---
+# Importing textblob pulls in NLTK and the pattern parser, which takes longer than
+# everything else at start-up. It is imported on first use so that --help and
+# argument errors return immediately.
+
+
+@functools.lru_cache(maxsize=None)
+def _textblob():
+    """
+    Imports the textblob package once per process, on first use.
+
+    Returns:
+        module: The textblob package.
+    """
+    return importlib.import_module("textblob")
+
+
+@functools.lru_cache(maxsize=None)
+def _textblob_exceptions():
+    """
+    Imports textblob.exceptions once per process, on first use.
+
+    Returns:
+        module: The textblob.exceptions module.
+    """
+    return importlib.import_module("textblob.exceptions")
+
+# --- Scoring Backends ---
+# "textblob" is TextBlob's pattern analyzer, "vader" the optional VADER scorer and
+# "fast" the vectorized lexicon scorer defined below.
+BACKENDS = ("textblob", "vader", "fast")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_vader():
+    """
+    Creates the VADER analyzer (and loads its lexicon) once per process.
+
+    Returns:
+        SentimentIntensityAnalyzer: The shared analyzer.
+    """
+    return SentimentIntensityAnalyzer()
+
+
+def _score_text(text, backend="textblob"):
+    """
+    Scores a text with the given backend.
+
+    VADER has no subjectivity score; the share of non-neutral text (1 - neu) is
+    reported in its place, and its compound score is used as polarity.
+
+    Args:
+        text (str): The text to score.
+        backend (str): One of BACKENDS.
+
+    Returns:
+        tuple: (polarity, subjectivity).
+    """
+    if backend == "vader":
+        scores = _get_vader().polarity_scores(text)
+        return scores['compound'], 1.0 - scores['neu']
+    if backend == "fast":
+        return _score_tokens(_tokenize(text))
+    sentiment = _textblob().TextBlob(text).sentiment
+    return sentiment.polarity, sentiment.subjectivity
+
+
+# --- Parallel Sentence Scoring ---
+# Sentences are independent scoring units, so long documents can be spread across
+# worker processes. Pattern's lexicon lookups are pure Python and hold the GIL,
+# which rules out threads.
+# When sentences are farmed out, the parent splits them with this regex instead of
+# Punkt so that splitting does not become the single-threaded bottleneck.
+# A run of ".", "!" or "?" ends a sentence only when followed by whitespace or the
+# end of the text, so "3.14" stays whole.
+_SENTENCE_RE = re.compile(r"(?:[^.!?]|[.!?]+(?=[^\s.!?]))+(?:[.!?]+|$)|[.!?]+")
+
+
+def _split_sentences(text):
+    """
+    Splits text into sentences with _SENTENCE_RE, used instead of Punkt by the
+    fast backend and by parallel sentence scoring.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        list: The stripped, non-empty sentences.
+    """
+    return [match.strip() for match in _SENTENCE_RE.findall(text) if match.strip()]
+
+
+def _count_words(tokens):
+    """Counts the words in a _TOKEN_RE token list, leaving out ellipses."""
+    return sum(1 for token in tokens if not token.startswith("."))
+
+
+def _score_sentence(text, backend="textblob", count_words=False):
+    """
+    Scores a single sentence. Defined at module level so it can be pickled
+    and dispatched to worker processes.
+
+    Args:
+        text (str): The sentence text.
+        backend (str): One of BACKENDS.
+        count_words (bool): If True, also count the sentence's TextBlob words, so
+                            the caller need not tokenize the whole document.
+
+    Returns:
+        tuple: (text, polarity, subjectivity, error, word_count). On failure
+               polarity and subjectivity are None and error holds the message;
+               word_count is None unless count_words is set.
+    """
+    word_count = len(_sentence_words(text)) if count_words else None
+    try:
+        polarity, subjectivity = _score_text(text, backend)
+        return text, polarity, subjectivity, None, word_count
+    except Exception as e:
+        # Report the failure back to the caller instead of aborting the whole batch.
+        return text, None, None, str(e), word_count
+
+
+def _sentence_words(sentence):
+    """
+    TextBlob's word tokens for text that is a single sentence. TextBlob.words
+    runs Punkt over the whole text first; for one sentence that split is a no-op,
+    so the Treebank tokenizer is applied directly, with the same punctuation
+    filtering as WordTokenizer.tokenize(include_punc=False).
+
+    Args:
+        sentence (str): The sentence text.
+
+    Returns:
+        list: The word tokens.
+    """
+    strip_punc = importlib.import_module("textblob.utils").strip_punc
+    tokens = importlib.import_module("nltk.tokenize").word_tokenize(sentence, preserve_line=True)
+    return [token if token.startswith("'") else strip_punc(token, all=False)
+            for token in tokens if strip_punc(token, all=False)]
+
+
+@functools.lru_cache(maxsize=None)
+def _warm_up(noun_phrases=False, backend="textblob", detect_language=False):
+    """
+    Forces the lazily loaded models of a backend (the pattern sentiment lexicon,
+    the NumPy lexicon arrays or the VADER analyzer) and, optionally, TextBlob's
+    noun phrase chunker and the lingua language detector into memory. Called
+    before forking the worker pool so workers inherit the parsed data instead of
+    each parsing it.
+
+    Args:
+        noun_phrases (bool): If True, also load the noun phrase extractor.
+        backend (str): One of BACKENDS.
+        detect_language (bool): If True, also build the language detector.
+    """
+    try:
+        if detect_language:
+            _get_language_detector()
+        if backend == "fast":
+            _get_lexicon_arrays()
+        elif backend == "vader":
+            _get_vader()
+        blob = _textblob().TextBlob("warmup")
+        if backend == "textblob":
+            blob.sentiment
+        if noun_phrases:
+            blob.noun_phrases
+    except Exception as e:
+        # Missing corpora surface properly during analysis; warm-up is best effort.
+        logger.debug("Model warm-up skipped: %s", e)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pool(processes):
+    """
+    Lazily creates (and caches) a worker pool of the requested size. Callers
+    run _warm_up for their backend first so the workers inherit its models.
+
+    Args:
+        processes (int): Number of worker processes.
+
+    Returns:
+        multiprocessing.pool.Pool: The shared pool.
+    """
+    logger.debug("Starting worker pool with %d processes.", processes)
+    # On Linux, fork lets workers share the warmed-up lexicon copy-on-write.
+    # Other platforms keep their default start method (fork is unsafe on macOS).
+    context = multiprocessing.get_context("fork" if sys.platform.startswith("linux") else None)
+    pool = context.Pool(processes=processes)
+    # Make sure workers are torn down when the interpreter exits.
+    atexit.register(pool.terminate)
+    return pool
+
+
+@functools.lru_cache(maxsize=None)
+def _get_language_detector():
+    """
+    Builds the lingua language detector once per process.
+
+    Returns:
+        lingua.LanguageDetector: The detector, or None if lingua is not installed.
+    """
+    if LanguageDetectorBuilder is None:
+        logger.debug("lingua is not installed; language detection falls back to TextBlob.")
+        return None
+    return LanguageDetectorBuilder.from_all_languages().build()
+
+
+# --- File Streaming ---
+FILE_CHUNK_SIZE = 64 * 1024 # Target bytes per analyzed chunk of a streamed file
+
+
+def _iter_file_chunks(file_path, chunk_size=FILE_CHUNK_SIZE):
+    """
+    Yields a UTF-8 file as text chunks of roughly chunk_size bytes, split on
+    paragraph boundaries where possible. The file is memory-mapped so only the
+    chunk being decoded is held in memory and the OS handles read-ahead.
+
+    Args:
+        file_path (str): The path to the input file.
+        chunk_size (int): Target chunk size in bytes.
+
+    Yields:
+        str: Non-blank text chunks, in file order.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return # mmap refuses empty files; there is nothing to yield anyway.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, size = 0, len(mm)
+            while start < size:
+                end = min(start + chunk_size, size)
+                if end < size:
+                    # Prefer a paragraph break, then a line break, inside the window.
+                    for separator in (b"\n\n", b"\r\n\r\n", b"\n"):
+                        cut = mm.rfind(separator, start, end)
+                        if cut != -1:
+                            end = cut + len(separator)
+                            break
+                    else:
+                        # No break at all: back off to a UTF-8 character boundary.
+                        while end > start and (mm[end] & 0xC0) == 0x80:
+                            end -= 1
+                # Match text-mode reads: strict UTF-8 and universal newlines.
+                chunk = mm[start:end].decode('utf-8').replace("\r\n", "\n")
+                start = end
+                if chunk.strip():
+                    yield chunk
+
+
+def _concat_sentences(parts):
+    """
+    Joins the column-wise sentence results of consecutive chunks.
+
+    Args:
+        parts (list): 'sentences' dicts from analyze_text, in document order.
+
+    Returns:
+        dict: A single 'sentences' dict covering all parts.
+    """
+    merged = {
+        "text": list(itertools.chain.from_iterable(part['text'] for part in parts)),
+        "polarity": np.concatenate([part['polarity'] for part in parts]),
+        "subjectivity": np.concatenate([part['subjectivity'] for part in parts]),
+        "classification": np.concatenate([part['classification'] for part in parts])
+    }
+    if any('error' in part for part in parts):
+        merged['error'] = list(itertools.chain.from_iterable(
+            part.get('error', [None] * len(part['text'])) for part in parts))
+    return merged
+
+
+# --- Batch Input ---
+BATCH_WINDOW_PER_JOB = 32 # Batch items handed to each worker per round
+
+
+def _iter_batch_texts(file_path):
+    """
+    Yields the inputs of a batch file. Each non-blank line is one input: plain
+    text, a JSON string, or a JSON object with a "text" field (JSONL).
+
+    Args:
+        file_path (str): The path to the batch file.
+
+    Yields:
+        str: One input text per non-blank line ("" if a JSON line has no text).
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            if line[0] in '{"':
+                # JSONL entry; anything that fails to parse is taken as plain text.
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    entry = line
+                if isinstance(entry, dict):
+                    entry = entry.get("text", "")
+                line = entry if isinstance(entry, str) else ""
+                if not line:
+                    logger.warning("Batch line %d has no text to analyze.", line_number)
+            yield line
+
+
+def _file_error(file_path, error):
+    """
+    Logs a failure to read an input file and builds the matching error result.
+
+    Args:
+        file_path (str): The path of the file that failed.
+        error (Exception): The exception raised while reading it.
+
+    Returns:
+        dict: Result with an 'error' key.
+    """
+    if isinstance(error, FileNotFoundError):
+        logger.error("File not found at path: %s.", file_path)
+        return {"error": f"File not found at path: {file_path}. Ensure its location is correct."}
+    if isinstance(error, IOError):
+        logger.error("Error reading file %s: %s", file_path, error, exc_info=error)
+        return {"error": f"Error reading file {file_path}: {error}. The file seems... resistant."}
+    logger.critical("An unexpected error occurred while processing file %s: %s", file_path, error, exc_info=error)
+    return {"error": f"An unexpected error occurred while processing file {file_path}: {error}. Consult the logs."}
+
+
+# --- Vectorized Lexicon Scoring ---
+# A NumPy re-implementation of pattern's lexicon averaging, used by
+# SentimentAnalyzer.analyze_text_fast. Tokens are scored in a single gather over
+# lexicon arrays instead of pattern's per-token Python loop.
+NEGATIONS = frozenset(("no", "not", "n't", "never"))
+# Tokenizes like pattern: words are split on whitespace, apostrophes and curly quotes,
+# "n't" is split off first ("isn't" -> "is", "n", "t", so pattern never negates it),
+# and punctuation is stripped from both ends of a word but kept inside it
+# ("first-rate"). Punctuation marks are dropped, except ellipses, which end
+# negation and modifier scopes as in pattern.
+_EDGE_PUNCTUATION = r".,;:!?()\[\]{}`\"@#$^&*+\-|=~_"
+_TOKEN_RE = re.compile(
+    r"[^\s'‘’“”{p}](?:[^\s'‘’“”]*?[^\s'‘’“”{p}])?(?=n't)"
+    r"|[^\s'‘’“”{p}](?:[^\s'‘’“”]*[^\s'‘’“”{p}])?"
+    r"|\.{{3,}}".format(p=_EDGE_PUNCTUATION))
+# Per-entry flag bits in the lexicon table.
+_KNOWN = 1 # Scored lexicon word
+_MODIFIER = 2 # Adverb that scales the next word ("very good")
+_NEGATION = 4 # Negator that flips the next word ("not good")
+_LY_MODIFIER = 8 # -ly modifier that takes a following negation ("really not good")
+
+
+def _tokenize(text):
+    """
+    Splits text into lowercase tokens for the lexicon scorer; see _TOKEN_RE.
+
+    Args:
+        text (str): The text to tokenize.
+
+    Returns:
+        list: Lowercase tokens.
+    """
+    return [token.lower() for token in _TOKEN_RE.findall(text)]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_lexicon_arrays():
+    """
+    Builds hash-indexed NumPy arrays from pattern's en-sentiment lexicon.
+    Scores are the POS-averaged values pattern itself uses for plain strings.
+    Negators get entries too, so a single index lookup per token yields its
+    scores and its negation/modifier role.
+
+    Returns:
+        tuple: (word_to_idx, polarity, subjectivity, intensity, flags), where
+               word_to_idx maps a lowercase word to its row in the arrays and
+               flags holds the _KNOWN/_MODIFIER/_NEGATION/_LY_MODIFIER bits.
+    """
+    pattern_sentiment = importlib.import_module("textblob.en").sentiment
+    word_to_idx = {}
+    rows = []
+    # Iterating the lazydict triggers pattern's one-off XML parse.
+    for word, by_pos in pattern_sentiment.items():
+        if " " in word or "'" in word:
+            # Multi-word and apostrophe entries ("for sure", "isn't") can never match
+            # a single token, in pattern or here.
+            continue
+        polarity, subjectivity, intensity = by_pos[None]
+        flags = _KNOWN
+        if any(pos in by_pos for pos in pattern_sentiment.modifiers):
+            flags |= _MODIFIER
+            if pattern_sentiment.modifier(word):
+                flags |= _LY_MODIFIER
+        if word in NEGATIONS:
+            flags |= _NEGATION
+        word_to_idx[word] = len(rows)
+        rows.append((polarity, subjectivity, intensity, flags))
+    for word in NEGATIONS - word_to_idx.keys():
+        word_to_idx[word] = len(rows)
+        rows.append((0.0, 0.0, 1.0, _NEGATION))
+    # float64 so that scores come out exactly as pattern computes them.
+    table = np.array(rows, dtype=np.float64).reshape(-1, 4)
+    logger.debug("Built vectorized sentiment lexicon with %d entries.", len(word_to_idx))
+    return word_to_idx, table[:, 0].copy(), table[:, 1].copy(), table[:, 2].copy(), table[:, 3].astype(np.uint8)
+
+
+def _score_tokens(tokens):
+    """
+    Scores a token list in one vectorized pass.
+
+    Reproduces pattern's assessment rules for untagged text with masks instead of
+    its per-token state machine:
+
+    * A known modifier ("very") is folded into the known word after it, scaling
+      its scores by the modifier's intensity. Chains ("very very good") fold into
+      one assessment, and the modifier survives unknown words of up to two
+      characters in between.
+    * A negation is kept across unknown one-character tokens ("not a good") and
+      negates the assessment of the next known word, halving and flipping its
+      polarity ("not good" = slightly bad). A negated modifier has its intensity
+      inverted ("not very good" is milder than "not good").
+    * A negation right after an -ly modifier negates the modifier's assessment
+      instead, keeping the modifier open ("really not good").
+
+    Apart from ellipses, punctuation marks are not tokens, so "!" boosts,
+    emoticons and paragraph breaks (which pattern treats as sentence ends)
+    are ignored.
+
+    Args:
+        tokens (list): Lowercase tokens.
+
+    Returns:
+        tuple: (polarity, subjectivity) as floats; (0.0, 0.0) if no token is known.
+    """
+    if not tokens:
+        return 0.0, 0.0
+    word_to_idx, pol_arr, subj_arr, int_arr, flag_arr = _get_lexicon_arrays()
+    idx = np.fromiter((word_to_idx.get(w, -1) for w in tokens), dtype=np.int32, count=len(tokens))
+    found = idx >= 0
+    flags = np.where(found, flag_arr[np.where(found, idx, 0)], 0)
+    known = (flags & _KNOWN).astype(bool)
+    if not known.any():
+        return 0.0, 0.0
+    negation = (flags & _NEGATION).astype(bool) & ~known
+    lengths = np.fromiter(map(len, tokens), dtype=np.int32, count=len(tokens))
+    unknown = ~known
+
+    # For every token, the position of the latest known word (-1 before the first)
+    # and of the latest unknown token that ends a modifier or a negation scope.
+    # Negations do not end an -ly modifier's scope; it takes them over.
+    positions = np.arange(len(tokens))
+    last_known = np.maximum.accumulate(np.where(known, positions, -1))
+    long_unknown = unknown & (lengths > 2)
+    last_modifier_break = np.maximum.accumulate(np.where(long_unknown, positions, -1))
+    last_ly_modifier_break = np.maximum.accumulate(np.where(long_unknown & ~negation, positions, -1))
+    last_negation = np.maximum.accumulate(np.where(negation, positions, -1))
+    last_negation_break = np.maximum.accumulate(
+        np.where(unknown & ~negation & (lengths > 1), positions, -1))
+
+    # State after each token: is a modifier still waiting for its word, and is a
+    # negation still pending?
+    has_known = last_known >= 0
+    prev_flags = np.where(has_known, flags[np.where(has_known, last_known, 0)], 0)
+    ly_modifier = (prev_flags & _LY_MODIFIER) != 0
+    modifier_open = (((prev_flags & _MODIFIER) != 0)
+                     & (np.where(ly_modifier, last_ly_modifier_break, last_modifier_break) < last_known))
+    absorbed = negation & modifier_open & ly_modifier
+    negation_open = ((last_negation > last_known) & (last_negation_break < last_negation)
+                     & ~absorbed[np.maximum(last_negation, 0)])
+
+    # Known words, in order, with the state they were reached in.
+    known_pos = positions[known]
+    folded = np.concatenate(([False], modifier_open[:-1]))[known_pos]
+    negated = np.concatenate(([False], negation_open[:-1]))[known_pos]
+    known_idx = idx[known_pos]
+    polarity = pol_arr[known_idx]
+    subjectivity = subj_arr[known_idx]
+    intensity = int_arr[known_idx]
+    intensity = np.where(negated, 1.0 / intensity, intensity)
+
+    # A folded word takes the intensity of the word it was folded into.
+    prev_intensity = np.concatenate(([1.0], intensity[:-1]))
+    polarity = np.where(folded, np.clip(polarity * prev_intensity, -1.0, 1.0), polarity)
+    subjectivity = np.where(folded, np.clip(subjectivity * prev_intensity, -1.0, 1.0), subjectivity)
+
+    # Each run of folded words forms one assessment, scored by its last word and
+    # negated if a negation preceded any of its words or was taken over by one.
+    taken_over = np.bincount(np.cumsum(known)[absorbed] - 1, minlength=len(known_pos)) > 0
+    assessment = np.cumsum(~folded) - 1
+    assessment_negated = np.bincount(assessment, weights=negated | taken_over) > 0
+    last = np.concatenate((~folded[1:], [True]))
+    polarity = polarity[last] * np.where(assessment_negated, -0.5, 1.0)
+    return float(polarity.mean()), float(subjectivity[last].mean())
+
+
+# --- Result Caching ---
+# Repeated short inputs (tweets, canned replies) are answered from a per-analyzer
+# LRU cache. Long texts are rarely repeated and would bloat it, so they bypass it.
+RESULT_CACHE_SIZE = 10_000
+RESULT_CACHE_MAX_TEXT = 1024 # Characters
+# Bits of the analysis-flags cache key.
+_SENTENCE_LEVEL = 1
+_NOUN_PHRASES = 2
+_DETECT_LANGUAGE = 4
+
+
+def _analysis_flags(sentence_level, include_noun_phrases, detect_language):
+    """
+    Packs the analysis options into the bitmask used as part of the cache key.
+
+    Returns:
+        int: Bitmask of _SENTENCE_LEVEL, _NOUN_PHRASES and _DETECT_LANGUAGE.
+    """
+    return ((_SENTENCE_LEVEL if sentence_level else 0)
+            | (_NOUN_PHRASES if include_noun_phrases else 0)
+            | (_DETECT_LANGUAGE if detect_language else 0))
+
+
+def _is_cacheable(text):
+    """Returns True if results for text are kept in the result cache."""
+    return isinstance(text, str) and len(text) <= RESULT_CACHE_MAX_TEXT
+
+
+def _with_timing(results, seconds):
+    """
+    Adds processing_time_seconds to a result, returning a copy rather than
+    modifying it; error results are returned as is.
+
+    Args:
+        results (dict): Analysis results.
+        seconds (float): Time taken to produce them for this call.
+
+    Returns:
+        dict: The results with their processing time.
+    """
+    if "error" in results:
+        return results
+    logger.info("Analysis completed in %.4f seconds.", seconds)
+    return dict(results, processing_time_seconds=seconds)
+
+
+# Classification labels, indexed by classify_sentiment's lookup.
+SENTIMENT_LABELS = ("Negative", "Neutral", "Positive")
+_LABEL_ARRAY = np.array(SENTIMENT_LABELS)
+
+
 class SentimentAnalyzer:
     """
     Analyzes text or files, supports sentence-level analysis, language detection,
@@ -24,7 +594,7 @@ class SentimentAnalyzer:
     Integrates logging for operational visibility.
     """
 
-    def __init__(self, positive_threshold=0.1, negative_threshold=-0.1):
+    def __init__(self, positive_threshold=0.1, negative_threshold=-0.1, jobs=1, backend="textblob"):
         """
         Initializes the analyzer with classification thresholds.
 
@@ -32,7 +602,21 @@ class SentimentAnalyzer:
             positive_threshold (float): Polarity value >= this is classified as positive.
             negative_threshold (float): Polarity value <= this is classified as negative.
                                         Values between thresholds are neutral.
+            jobs (int): Worker processes for sentence-level analysis. 1 runs serially
+                        (no pool overhead); 0 or less uses all available cores.
+            backend (str): Sentiment scorer, one of BACKENDS. Noun phrases and language
+                           detection always use TextBlob; "fast" also splits sentences
+                           and counts words with regexes instead of TextBlob's tokenizers.
         """
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        if backend not in BACKENDS:
+            logger.warning("Unknown sentiment backend '%s'. Using default 'textblob'.", backend)
+            backend = "textblob"
+        elif backend == "vader" and SentimentIntensityAnalyzer is None:
+            logger.warning("The 'vader' backend requires the vaderSentiment package. Using default 'textblob'.")
+            backend = "textblob"
+        self.backend = backend
+        self._init_cache()
         # Validate thresholds and log a warning if they are illogical.
         if not (-1.0 <= negative_threshold <= positive_threshold <= 1.0):
             logger.warning("Classification thresholds are set illogically (%f, %f). Using defaults (-0.1, 0.1).",
@@ -45,6 +629,21 @@ class SentimentAnalyzer:
             logger.debug("Initialized Analyzer with thresholds: Pos=%.2f, Neg=%.2f",
                          self.positive_threshold, self.negative_threshold)
 
+    def _init_cache(self):
+        """Creates this analyzer's result cache, an LRU dict keyed by _cache_key."""
+        self._result_cache = collections.OrderedDict()
+
+    def __getstate__(self):
+        # The analyzer is pickled for every pool task, so the cache stays behind.
+        # Batch runs answer repeats from the parent's cache and only send misses.
+        state = self.__dict__.copy()
+        state.pop('_result_cache', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_cache()
+
     def classify_sentiment(self, polarity):
         """
         Classifies sentiment based on polarity and defined thresholds.
@@ -55,12 +654,63 @@ class SentimentAnalyzer:
         Returns:
             str: 'Positive', 'Negative', or 'Neutral'.
         """
-        if polarity >= self.positive_threshold:
-            return "Positive"
-        elif polarity <= self.negative_threshold:
-            return "Negative"
-        else:
-            return "Neutral"
+        # Branchless lookup: 2 if at/above the positive threshold, 0 if at/below the
+        # negative one, 1 otherwise (including NaN). Positive wins when the thresholds
+        # coincide.
+        above = polarity >= self.positive_threshold
+        return SENTIMENT_LABELS[1 + above - ((not above) & (polarity <= self.negative_threshold))]
+
+    def classify_sentiments_batch(self, polarities):
+        """
+        Vectorized classify_sentiment for many polarity scores at once.
+
+        Args:
+            polarities (array-like): Polarity scores.
+
+        Returns:
+            numpy.ndarray: Array of 'Positive', 'Negative' or 'Neutral' labels.
+        """
+        polarities = np.asarray(polarities)
+        above = polarities >= self.positive_threshold
+        idx = 1 + above.astype(np.int8) - (~above & (polarities <= self.negative_threshold))
+        return _LABEL_ARRAY[idx]
+
+    def _cache_key(self, text, flags):
+        """
+        Builds the result cache key. Thresholds and backend are public attributes
+        that may be changed after construction, so they are part of it.
+
+        Returns:
+            tuple: (text, flags, positive_threshold, negative_threshold, backend).
+        """
+        return text, flags, self.positive_threshold, self.negative_threshold, self.backend
+
+    def _cached_result(self, text, flags):
+        """
+        Looks up a result in the cache, marking it as recently used.
+
+        Returns:
+            dict: A copy of the cached result, or None on a miss or for an
+                  uncacheable text.
+        """
+        if not _is_cacheable(text):
+            return None
+        key = self._cache_key(text, flags)
+        results = self._result_cache.get(key)
+        if results is None:
+            return None
+        self._result_cache.move_to_end(key)
+        return copy.deepcopy(results)
+
+    def _cache_result(self, text, flags, results):
+        """
+        Stores a copy of a result in the cache, evicting the least recently used
+        one when full. Copies go in and out so callers may modify their results.
+        """
+        if _is_cacheable(text):
+            self._result_cache[self._cache_key(text, flags)] = copy.deepcopy(results)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
 
     def analyze_text(self, text, sentence_level=False, include_noun_phrases=False, detect_language=False):
         """
@@ -76,60 +726,190 @@ class SentimentAnalyzer:
             dict: Analysis results. Includes 'error' key if analysis fails.
                   Structure depends on flags like sentence_level and json output.
         """
+        return self._analyze(text, _analysis_flags(sentence_level, include_noun_phrases, detect_language))
+
+    def _analyze(self, text, flags):
+        """
+        analyze_text for an options bitmask: serves short texts from the cache and
+        adds the processing time when the log level is INFO or lower.
+
+        Args:
+            text (str): The input text.
+            flags (int): Bitmask of _SENTENCE_LEVEL, _NOUN_PHRASES and _DETECT_LANGUAGE.
+
+        Returns:
+            dict: Analysis results, as for analyze_text.
+        """
+        # Timing is only reported when INFO logging is on, keeping the hot path free of
+        # clock calls in high-throughput batch runs. It is measured here, outside the
+        # cache, so a cache hit reports the lookup and not the original computation.
+        timed = logger.isEnabledFor(logging.INFO)
+        if timed:
+            start_time = time.perf_counter()
+        results = self._cached_result(text, flags)
+        if results is None:
+            results = self._analyze_text(text, flags)
+            self._cache_result(text, flags, results)
+        if timed:
+            results = _with_timing(results, time.perf_counter() - start_time)
+        return results
+
+    def _analyze_measured(self, text, flags):
+        """
+        Uncached analysis run by pool workers for batch inputs.
+
+        Args:
+            text (str): The input text.
+            flags (int): Bitmask of _SENTENCE_LEVEL, _NOUN_PHRASES and _DETECT_LANGUAGE.
+
+        Returns:
+            tuple: (results, seconds); seconds is None unless INFO logging is on.
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return self._analyze_text(text, flags), None
+        start_time = time.perf_counter()
+        results = self._analyze_text(text, flags)
+        return results, time.perf_counter() - start_time
+
+    def _analyze_text(self, text, flags):
+        """
+        Uncached implementation of analyze_text.
+
+        Args:
+            text (str): The input text.
+            flags (int): Bitmask of _SENTENCE_LEVEL, _NOUN_PHRASES and _DETECT_LANGUAGE.
+
+        Returns:
+            dict: Analysis results, as for analyze_text.
+        """
+        sentence_level = bool(flags & _SENTENCE_LEVEL)
+        include_noun_phrases = bool(flags & _NOUN_PHRASES)
+        detect_language = bool(flags & _DETECT_LANGUAGE)
+
         if not text or not isinstance(text, str) or not text.strip():
             # Log and return error for empty input.
             logger.warning("Attempted to analyze empty or whitespace-only text.")
             return {"error": "The text provided is devoid of content, My Lord. Analysis requires substance."}
 
         logger.info("Starting analysis for text snippet (first 50 chars): '%s...'", text[:50])
-        start_time = time.time()
-
+        TextBlob = _textblob().TextBlob
+        textblob_exceptions = _textblob_exceptions()
         try:
             blob = TextBlob(text)
-            results = {"analysis_timestamp": time.time()} # Timestamp for record-keeping
+            # The splitter depends only on the options, so a document splits the same
+            # way whether it is analyzed here or, as a file chunk or batch item, in a
+            # pool worker. The fast backend keeps TextBlob's tokenizers out of its path
+            # entirely and takes its statistics from the regexes the lexicon scorer uses.
+            fast = self.backend == "fast"
+            regex_split = fast or (sentence_level and self.jobs > 1)
+            # Pool workers are daemonic and cannot start a nested pool; score serially there.
+            parallel = sentence_level and self.jobs > 1 and not multiprocessing.current_process().daemon
+            # Tokenize once; both the sentiment branches and the statistics reuse these.
+            single_sentence = not any(terminator in text for terminator in ".!?")
+            if single_sentence:
+                # No sentence terminators: the text is a single sentence, so skip Punkt.
+                sentence_texts = [blob.raw]
+            elif regex_split:
+                sentence_texts = _split_sentences(text)
+            else:
+                sentence_texts = [sentence.raw for sentence in blob.sentences]
+            # With the regex splitter, the words are counted sentence by sentence
+            # alongside scoring (in the workers, when parallel) instead of running
+            # Punkt over the whole text for blob.words.
+            count_words = regex_split and not fast and not single_sentence
+            if fast:
+                word_count = _count_words(_TOKEN_RE.findall(text))
+            elif single_sentence:
+                # blob.words would run Punkt over the text again.
+                word_count = len(_sentence_words(text))
+            elif count_words:
+                word_count = 0  # Summed from the sentence results below.
+            else:
+                word_count = len(blob.words)
+            results = {}
 
             # --- Core Sentiment Analysis ---
             if sentence_level:
-                results['sentences'] = []
                 logger.debug("Analyzing sentiment at sentence level.")
-                for i, sentence in enumerate(blob.sentences):
-                    try:
-                        sentiment = sentence.sentiment
-                        sentence_data = {
-                            "text": str(sentence),
-                            "polarity": sentiment.polarity,
-                            "subjectivity": sentiment.subjectivity,
-                            "classification": self.classify_sentiment(sentiment.polarity)
-                        }
-                        results['sentences'].append(sentence_data)
-                        logger.debug("Analyzed sentence %d: Polarity=%.4f", i+1, sentiment.polarity)
-                    except Exception as e:
-                         # Log but attempt to continue if a single sentence fails.
-                         logger.error("Error analyzing sentence %d: %s", i, e, exc_info=True)
-                         results['sentences'].append({"text": str(sentence), "error": str(e)})
-
-                # Still provide overall summary
-                overall_sentiment = blob.sentiment
+                score = functools.partial(_score_sentence, backend=self.backend, count_words=count_words)
+                if parallel and len(sentence_texts) > 1:
+                    # Farm sentences out to the worker pool; imap keeps document order.
+                    logger.debug("Scoring %d sentences across %d processes.", len(sentence_texts), self.jobs)
+                    chunksize = max(1, len(sentence_texts) // (4 * self.jobs))
+                    _warm_up(backend=self.backend)
+                    scored = _get_pool(self.jobs).imap(score, sentence_texts, chunksize=chunksize)
+                else:
+                    scored = map(score, sentence_texts)
+
+                # Sentence scores are stored column-wise in float32 arrays, which is far
+                # smaller than a dict of Python floats per sentence.
+                polarities = np.empty(len(sentence_texts), dtype=np.float32)
+                subjectivities = np.empty(len(sentence_texts), dtype=np.float32)
+                errors = None
+                # Running word-weighted sums for the overall score, fused into this pass.
+                total_polarity = total_subjectivity = 0.0
+                total_words = 0
+                for i, (sentence_text, polarity, subjectivity, error, sentence_words) in enumerate(scored):
+                    if count_words:
+                        word_count += sentence_words
+                    if error is not None:
+                        # Log but continue if a single sentence fails.
+                        logger.error("Error analyzing sentence %d: %s", i, error)
+                        if errors is None:
+                            errors = [None] * len(sentence_texts)
+                        errors[i] = error
+                        polarities[i] = subjectivities[i] = np.nan
+                        continue
+                    polarities[i] = polarity
+                    subjectivities[i] = subjectivity
+                    n_words = len(sentence_text.split())
+                    total_polarity += polarity * n_words
+                    total_subjectivity += subjectivity * n_words
+                    total_words += n_words
+                    logger.debug("Analyzed sentence %d: Polarity=%.4f", i+1, polarity)
+
+                # Still provide overall summary, derived from the sentence scores rather than
+                # rescoring the whole text: the mean of sentence scores weighted by length.
+                if total_words:
+                    overall_polarity = total_polarity / total_words
+                    overall_subjectivity = total_subjectivity / total_words
+                else:
+                    # Every sentence failed; fall back to scoring the text as a whole.
+                    overall_polarity, overall_subjectivity = _score_text(text, self.backend)
+                classifications = self.classify_sentiments_batch(polarities)
+                results['sentences'] = {
+                    "text": sentence_texts,
+                    "polarity": polarities,
+                    "subjectivity": subjectivities,
+                    "classification": classifications
+                }
+                if errors is not None:
+                    # Failed sentences carry NaN scores, no classification and their message.
+                    classifications[np.isnan(polarities)] = ""
+                    results['sentences']['error'] = errors
                 results['overall'] = {
-                    "polarity": overall_sentiment.polarity,
-                    "subjectivity": overall_sentiment.subjectivity,
-                    "classification": self.classify_sentiment(overall_sentiment.polarity)
+                    "polarity": overall_polarity,
+                    "subjectivity": overall_subjectivity,
+                    "classification": self.classify_sentiment(overall_polarity)
                 }
-                logger.debug("Overall sentiment calculated: Polarity=%.4f", overall_sentiment.polarity)
+                logger.debug("Overall sentiment calculated: Polarity=%.4f", overall_polarity)
             else:
                 # Analyze the entire text block.
-                overall_sentiment = blob.sentiment
+                if self.backend == "textblob":
+                    overall_polarity, overall_subjectivity = blob.sentiment
+                else:
+                    overall_polarity, overall_subjectivity = _score_text(text, self.backend)
                 results['overall'] = {
-                    "polarity": overall_sentiment.polarity,
-                    "subjectivity": overall_sentiment.subjectivity,
-                    "classification": self.classify_sentiment(overall_sentiment.polarity)
+                    "polarity": overall_polarity,
+                    "subjectivity": overall_subjectivity,
+                    "classification": self.classify_sentiment(overall_polarity)
                 }
-                logger.debug("Overall sentiment calculated: Polarity=%.4f", overall_sentiment.polarity)
+                logger.debug("Overall sentiment calculated: Polarity=%.4f", overall_polarity)
 
             # --- Additional Analysis Features ---
             results['text_stats'] = {
-                "word_count": len(blob.words),
-                "sentence_count": len(blob.sentences)
+                "word_count": word_count,
+                "sentence_count": len(sentence_texts)
             }
             logger.debug("Calculated text statistics: Words=%d, Sentences=%d",
                          results['text_stats']['word_count'], results['text_stats']['sentence_count'])
@@ -137,17 +917,32 @@ class SentimentAnalyzer:
 
             if include_noun_phrases:
                 # Extracting key noun phrases.
-                noun_phrases = [str(phrase) for phrase in blob.noun_phrases]
+                if len(text.split(None, 2)) < 3:
+                    # Too short for a multi-word phrase; skip the POS tagger and chunker.
+                    noun_phrases = []
+                else:
+                    noun_phrases = list(map(str, blob.noun_phrases))
                 results['noun_phrases'] = noun_phrases
                 logger.debug("Extracted %d noun phrases.", len(noun_phrases))
 
             if detect_language:
                 # Attempting language identification.
                 try:
-                    lang = blob.detect_language()
-                    results['detected_language'] = lang
-                    logger.debug("Detected language: %s", lang)
-                except (TranslatorError, NotTranslated) as e:
+                    detector = _get_language_detector()
+                    if detector is not None:
+                        # Local detection; the single-language call is much faster than
+                        # detect_multiple_languages_of.
+                        language = detector.detect_language_of(text)
+                        lang = language.iso_code_639_1.name.lower() if language is not None else None
+                    else:
+                        lang = blob.detect_language()
+                    if lang is None:
+                        logger.warning("Could not reliably detect language. Input text might be too short or unusual.")
+                        results['detected_language_error'] = "No language could be identified with confidence."
+                    else:
+                        results['detected_language'] = lang
+                        logger.debug("Detected language: %s", lang)
+                except (textblob_exceptions.TranslatorError, textblob_exceptions.NotTranslated) as e:
                     # TextBlob's language detection relies on translation services internally.
                     logger.warning("Could not reliably detect language: %s. Input text might be too short or unusual.", e)
                     results['detected_language_error'] = str(e)
@@ -157,13 +952,9 @@ class SentimentAnalyzer:
                      results['detected_language_error'] = str(e)
 
 
-            end_time = time.time()
-            results['processing_time_seconds'] = end_time - start_time
-            logger.info("Analysis completed in %.4f seconds.", results['processing_time_seconds'])
-
             return results
 
-        except TextBlobException as e:
+        except textblob_exceptions.TextBlobException as e:
             # Log specific TextBlob errors with trace back.
             logger.error("A TextBlob-specific issue occurred during analysis: %s", e, exc_info=True)
             return {"error": f"A TextBlob-specific issue occurred: {e}. The library appears... temperamental."}
@@ -186,17 +977,77 @@ class SentimentAnalyzer:
             dict: Analysis results. Includes 'error' key if file reading or analysis fails.
         """
         logger.info("Attempting to read file: %s", file_path)
+        analysis_timestamp = time.time() # Timestamp for record-keeping, once per file
+        timed = logger.isEnabledFor(logging.INFO)
+        if timed:
+            start_time = time.perf_counter()
         try:
-            # Attempting to read the entire file content.
-            # Note: For extremely large files, reading all at once can consume significant memory.
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            logger.info("Successfully read file: %s. File size: %d characters.", file_path, len(text))
-            # Proceed with the analysis of the file's content.
-            return self.analyze_text(text,
-                                     sentence_level=sentence_level,
-                                     include_noun_phrases=include_noun_phrases,
-                                     detect_language=detect_language)
+            # Stream the file in paragraph-aligned chunks so memory stays bounded by the
+            # chunk size rather than the file size.
+            chunks = _iter_file_chunks(file_path)
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                # Empty or whitespace-only file; let analyze_text report it.
+                return self.analyze_text("")
+
+            results = {"analysis_timestamp": analysis_timestamp}
+            sentence_parts = []
+            sums = {"polarity": 0.0, "subjectivity": 0.0, "sentences": 0}
+            word_count = 0
+            chunk_count = 0
+
+            if self.jobs > 1:
+                # Load the models before the first chunk can fork the pool
+                # (sentence-level analysis does), so every worker inherits them.
+                _warm_up(noun_phrases=include_noun_phrases, backend=self.backend)
+            # Language is detected once, from the opening chunk.
+            first_results = self.analyze_text(first_chunk,
+                                              sentence_level=sentence_level,
+                                              include_noun_phrases=include_noun_phrases,
+                                              detect_language=detect_language)
+            for key in ('detected_language', 'detected_language_error'):
+                if key in first_results:
+                    results[key] = first_results[key]
+
+            analyze = functools.partial(self.analyze_text,
+                                        sentence_level=sentence_level,
+                                        include_noun_phrases=include_noun_phrases)
+            # Chunks are large, so only a couple per worker are in flight at a time.
+            for chunk_results in itertools.chain([first_results],
+                                                 self._map_windowed(analyze, chunks, self.jobs * 2)):
+                if "error" in chunk_results:
+                    return chunk_results
+                chunk_count += 1
+                # Weight each chunk's scores by its sentence count so the running result
+                # is the mean over all sentences in the file.
+                n_sentences = chunk_results['text_stats']['sentence_count']
+                sums['polarity'] += chunk_results['overall']['polarity'] * n_sentences
+                sums['subjectivity'] += chunk_results['overall']['subjectivity'] * n_sentences
+                sums['sentences'] += n_sentences
+                word_count += chunk_results['text_stats']['word_count']
+                if sentence_level:
+                    sentence_parts.append(chunk_results['sentences'])
+                if include_noun_phrases:
+                    results.setdefault('noun_phrases', []).extend(chunk_results['noun_phrases'])
+
+            if sentence_level:
+                results['sentences'] = _concat_sentences(sentence_parts)
+            n_sentences = max(sums['sentences'], 1)
+            polarity = sums['polarity'] / n_sentences
+            results['overall'] = {
+                "polarity": polarity,
+                "subjectivity": sums['subjectivity'] / n_sentences,
+                "classification": self.classify_sentiment(polarity)
+            }
+            results['text_stats'] = {
+                "word_count": word_count,
+                "sentence_count": sums['sentences']
+            }
+            if timed:
+                results['processing_time_seconds'] = time.perf_counter() - start_time
+                logger.info("Successfully analyzed file: %s in %d chunks (%.4f seconds).",
+                            file_path, chunk_count, results['processing_time_seconds'])
+            return results
         except FileNotFoundError:
             # Log file not found errors.
             logger.error("File not found at path: %s.", file_path)
@@ -214,6 +1065,300 @@ class SentimentAnalyzer:
             logger.critical("An unexpected error occurred while processing file %s: %s", file_path, e, exc_info=True)
             return {"error": f"An unexpected error occurred while processing file {file_path}: {e}. Consult the logs."}
 
+    def analyze_text_fast(self, text):
+        """
+        Scores a text with the vectorized lexicon scorer instead of TextBlob.
+
+        Much faster on large inputs. Follows pattern's negation and modifier
+        rules for untagged text, but ignores punctuation ("!" boosts, emoticons)
+        and reports overall sentiment and basic statistics only.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            dict: Analysis results with 'overall' and 'text_stats', or an 'error' key.
+        """
+        if not text or not isinstance(text, str) or not text.strip():
+            logger.warning("Attempted to analyze empty or whitespace-only text.")
+            return {"error": "The text provided is devoid of content, My Lord. Analysis requires substance."}
+
+        timed = logger.isEnabledFor(logging.INFO)
+        if timed:
+            start_time = time.perf_counter()
+        try:
+            tokens = _tokenize(text)
+            polarity, subjectivity = _score_tokens(tokens)
+            results = {
+                "overall": {
+                    "polarity": polarity,
+                    "subjectivity": subjectivity,
+                    "classification": self.classify_sentiment(polarity)
+                },
+                "text_stats": {
+                    "word_count": _count_words(tokens),
+                    "sentence_count": len(_split_sentences(text))
+                }
+            }
+            if timed:
+                results['processing_time_seconds'] = time.perf_counter() - start_time
+            logger.debug("Fast overall sentiment calculated: Polarity=%.4f", polarity)
+            return results
+        except Exception as e:
+            logger.critical("A critical unexpected error arose during analysis: %s", e, exc_info=True)
+            return {"error": f"A critical unexpected error arose during analysis: {e}. Immediate attention required."}
+
+    def _map_windowed(self, func, items, window_size):
+        """
+        Applies func to items in order, lazily. With jobs > 1 the items are handed to
+        the worker pool a bounded window at a time; an unbounded imap would drain the
+        whole input into the task queue.
+
+        Args:
+            func (callable): Picklable single-argument function.
+            items (iterable): The inputs.
+            window_size (int): Inputs handed to the pool per round.
+
+        Yields:
+            The results of func, in input order.
+        """
+        if self.jobs <= 1:
+            yield from map(func, items)
+            return
+        pool = _get_pool(self.jobs)
+        items = iter(items)
+        for window in iter(lambda: list(itertools.islice(items, window_size)), []):
+            yield from pool.map(func, window)
+
+    def iter_analyze_batch(self, texts, sentence_level=False, include_noun_phrases=False, detect_language=False):
+        """
+        Lazily analyzes many texts in one process so the TextBlob/pattern start-up cost
+        is paid once rather than once per input. Results are yielded as they become
+        available, so memory does not grow with the number of inputs.
+
+        Args:
+            texts (iterable): The input text strings.
+            sentence_level (bool): If True, analyze each sentence separately.
+            include_noun_phrases (bool): If True, extract noun phrases.
+            detect_language (bool): If True, attempt language detection.
+
+        Yields:
+            dict: One analysis result per input, in input order. Failed items carry
+                  an 'error' key; the rest of the batch is unaffected.
+        """
+        flags = _analysis_flags(sentence_level, include_noun_phrases, detect_language)
+        if self.jobs > 1:
+            # Spread whole items across the pool; each worker scores its sentences serially.
+            logger.debug("Analyzing batch items across %d processes.", self.jobs)
+            _warm_up(noun_phrases=include_noun_phrases, backend=self.backend,
+                     detect_language=detect_language)
+            return self._iter_analyze_pooled(texts, flags, self.jobs * BATCH_WINDOW_PER_JOB)
+        return (self._analyze(text, flags) for text in texts)
+
+    def _iter_analyze_pooled(self, texts, flags, window_size):
+        """
+        Pool-backed iter_analyze_batch. Inputs are handed over a window at a time;
+        cache hits are answered in this process and each distinct miss in a window
+        is analyzed once, by a worker.
+
+        Args:
+            texts (iterable): The input text strings.
+            flags (int): Bitmask of _SENTENCE_LEVEL, _NOUN_PHRASES and _DETECT_LANGUAGE.
+            window_size (int): Inputs read per round.
+
+        Yields:
+            dict: One analysis result per input, in input order.
+        """
+        pool = _get_pool(self.jobs)
+        task = functools.partial(self._analyze_measured, flags=flags)
+        texts = iter(texts)
+        for window in iter(lambda: list(itertools.islice(texts, window_size)), []):
+            queued = set()
+            misses = []
+            for i, text in enumerate(window):
+                if not _is_cacheable(text):
+                    misses.append(i)
+                elif text not in queued and self._cache_key(text, flags) not in self._result_cache:
+                    queued.add(text)
+                    misses.append(i)
+            computed = dict(zip(misses, pool.map(task, [window[i] for i in misses])))
+            for i, text in enumerate(window):
+                if i in computed:
+                    results, seconds = computed[i]
+                    self._cache_result(text, flags, results)
+                    yield results if seconds is None else _with_timing(results, seconds)
+                else:
+                    # Cached before this window or earlier in it.
+                    yield self._analyze(text, flags)
+
+    def analyze_batch(self, texts, sentence_level=False, include_noun_phrases=False, detect_language=False):
+        """
+        Analyzes many texts in one process; see iter_analyze_batch.
+
+        Args:
+            texts (iterable): The input text strings.
+            sentence_level (bool): If True, analyze each sentence separately.
+            include_noun_phrases (bool): If True, extract noun phrases.
+            detect_language (bool): If True, attempt language detection.
+
+        Returns:
+            list: One analysis result dict per input, in input order.
+        """
+        return list(self.iter_analyze_batch(texts,
+                                            sentence_level=sentence_level,
+                                            include_noun_phrases=include_noun_phrases,
+                                            detect_language=detect_language))
+
+    def iter_batch_file(self, file_path, sentence_level=False, include_noun_phrases=False, detect_language=False):
+        """
+        Streams the results for every input in a batch file; see _iter_batch_texts
+        for the file format.
+
+        Args:
+            file_path (str): The path to the batch file.
+            sentence_level (bool): If True, analyze each sentence separately.
+            include_noun_phrases (bool): If True, extract noun phrases.
+            detect_language (bool): If True, attempt language detection.
+
+        Yields:
+            dict: One analysis result per input, in input order.
+
+        Raises:
+            OSError, ValueError: If the batch file cannot be read or decoded.
+        """
+        logger.info("Attempting to read batch file: %s", file_path)
+        return self.iter_analyze_batch(_iter_batch_texts(file_path),
+                                       sentence_level=sentence_level,
+                                       include_noun_phrases=include_noun_phrases,
+                                       detect_language=detect_language)
+
+    def analyze_batch_file(self, file_path, sentence_level=False, include_noun_phrases=False, detect_language=False):
+        """
+        Reads a batch file and analyzes every input it contains.
+
+        Each non-blank line is one input: either plain text, a JSON string, or a
+        JSON object with a "text" field (JSONL).
+
+        Args:
+            file_path (str): The path to the batch file.
+            sentence_level (bool): If True, analyze each sentence separately.
+            include_noun_phrases (bool): If True, extract noun phrases.
+            detect_language (bool): If True, attempt language detection.
+
+        Returns:
+            dict: {'results': [...]} with one entry per input, or an 'error' key if
+                  the batch file cannot be read.
+        """
+        analysis_timestamp = time.time() # Timestamp for record-keeping, once per batch
+        try:
+            results = list(self.iter_batch_file(file_path,
+                                                sentence_level=sentence_level,
+                                                include_noun_phrases=include_noun_phrases,
+                                                detect_language=detect_language))
+        except Exception as e:
+            return _file_error(file_path, e)
+        logger.info("Successfully analyzed batch file: %s. Inputs: %d.", file_path, len(results))
+        return {"analysis_timestamp": analysis_timestamp, "results": results}
+
+
+def _json_default(obj):
+    """
+    Converts the NumPy columns in sentence results to JSON-compatible lists.
+    Float32 values are written in their shortest form and NaN (failed
+    sentences) as null.
+
+    Args:
+        obj: An object the JSON encoder cannot handle natively.
+
+    Returns:
+        list: The converted values.
+    """
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == 'f':
+            return [None if np.isnan(value) else float(str(value)) for value in obj]
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(results, indent=True):
+    """
+    Serializes analysis results to UTF-8 JSON, using orjson when available.
+
+    Args:
+        results (dict): Analysis results.
+        indent (bool): If False, emit compact single-line JSON (for NDJSON).
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        # orjson writes float32 arrays natively; label arrays go through _json_default.
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(results, default=_json_default, option=option)
+    # ensure_ascii=False for better human readability of non-ASCII chars in output
+    if indent:
+        return json.dumps(results, indent=4, ensure_ascii=False, default=_json_default).encode('utf-8')
+    return json.dumps(results, separators=(",", ":"), ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def print_text_results(results):
+    """
+    Prints a single analysis result in human-readable plain text.
+
+    Args:
+        results (dict): Analysis results as returned by SentimentAnalyzer.
+    """
+    print("\n--- Sentiment and Text Analysis Results ---")
+
+    # Display core sentiment and stats
+    if 'overall' in results:
+        overall = results['overall']
+        print("Overall Analysis:")
+        print(f"  Polarity:         {overall['polarity']:.4f}")
+        print(f"  Subjectivity:     {overall['subjectivity']:.4f}")
+        print(f"  Classification:   {overall['classification']}")
+
+    if 'text_stats' in results:
+         stats = results['text_stats']
+         print("Text Statistics:")
+         print(f"  Word Count:       {stats['word_count']}")
+         print(f"  Sentence Count:   {stats['sentence_count']}")
+
+    if 'detected_language' in results:
+        print(f"Detected Language:  {results['detected_language']}")
+    elif 'detected_language_error' in results:
+         print(f"Language Detection: Failed - {results['detected_language_error']}")
+
+
+    if 'noun_phrases' in results and results['noun_phrases']:
+        # List extracted noun phrases if found.
+        print("\nKey Noun Phrases:")
+        # Limit display of noun phrases for brevity in plain text
+        display_phrases = results['noun_phrases'][:10] # Show first 10
+        print(f"  {', '.join(display_phrases)}{'...' if len(results['noun_phrases']) > 10 else ''}")
+
+
+    if 'sentences' in results:
+        # If sentence-level analysis was requested, list results for each.
+        print("\nSentence-Level Analysis:")
+        sentences = results['sentences']
+        errors = sentences.get('error')
+        for i, sentence_text in enumerate(sentences['text']):
+             if errors is not None and errors[i] is not None:
+                 print(f"  Sentence {i+1}: Analysis Failed - {errors[i]}")
+                 continue # Skip to next sentence if analysis failed for this one
+
+             # Ellipsize long sentences for readability in the output.
+             display_text = sentence_text if len(sentence_text) < 80 else sentence_text[:77] + "..."
+             print(f"  Sentence {i+1}: \"{display_text}\"")
+             print(f"    Polarity:       {sentences['polarity'][i]:.4f}")
+             print(f"    Subjectivity:   {sentences['subjectivity'][i]:.4f}")
+             print(f"    Classification: {sentences['classification'][i]}")
+
+    # Display processing time
+    if 'processing_time_seconds' in results:
+         print(f"\nProcessing Time:  {results['processing_time_seconds']:.4f} seconds")
+
 
 def main():
     """
@@ -237,7 +1382,12 @@ def main():
     input_group.add_argument(
         "-f", "--file",
         help="Path to a text file for analysis.\n"
-             "Note: Very large files may cause Memory Errors."
+             "Large files are streamed in paragraph-aligned chunks."
+    )
+    input_group.add_argument(
+        "-b", "--batch",
+        help="Path to a batch file with one input per line (plain text or JSONL\n"
+             "objects with a \"text\" field). All inputs are analyzed in one run."
     )
 
     # --- Analysis Options ---
@@ -256,13 +1406,37 @@ def main():
         action="store_true",
         help="Attempt to detect the language of the input text."
     )
+    parser.add_argument(
+        "--backend",
+        default="textblob",
+        choices=BACKENDS,
+        help="Sentiment scorer (default: textblob).\n"
+             "textblob: TextBlob's pattern analyzer\n"
+             "vader: VADER (requires the vaderSentiment package)\n"
+             "fast: vectorized lexicon scorer (approximates textblob; sentences\n"
+             "      and words are split with regexes instead of TextBlob/NLTK)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for sentence-level and batch analysis (default: 1, no pool).\n"
+             "Use 0 to match the number of CPU cores."
+    )
 
     # --- Output Options ---
-    parser.add_argument(
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument(
         "-j", "--json",
         action="store_true",
         help="Output results in JSON format (recommended for scripting/automation)."
     )
+    output_group.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Output one compact JSON object per line. With --batch, each result\n"
+             "is written as soon as it is ready instead of after the whole batch."
+    )
 
     # --- Configuration Options ---
     parser.add_argument(
@@ -298,7 +1472,9 @@ def main():
     # --- Initialize and Run Analysis ---
     analyzer = SentimentAnalyzer(
         positive_threshold=args.pos_threshold,
-        negative_threshold=args.neg_threshold
+        negative_threshold=args.neg_threshold,
+        jobs=args.jobs,
+        backend=args.backend
     )
 
     # Determine input source and perform analysis.
@@ -320,6 +1496,54 @@ def main():
             include_noun_phrases=args.noun_phrases,
             detect_language=args.detect_lang
         )
+    elif args.batch and args.ndjson:
+        # Stream results line by line; nothing is accumulated, so memory stays flat
+        # and downstream consumers can start before the batch finishes.
+        logger.info("Initiating streamed batch analysis for file input: %s", args.batch)
+        failed = False
+        # Only reading and analyzing the input counts as a file error; output
+        # failures are handled separately below.
+        try:
+            items = analyzer.iter_batch_file(
+                args.batch,
+                sentence_level=args.sentence_level,
+                include_noun_phrases=args.noun_phrases,
+                detect_language=args.detect_lang)
+            item = next(items, None)
+        except Exception as e:
+            print(f"Operation failed: {_file_error(args.batch, e)['error']}", file=sys.stderr)
+            sys.exit(1)
+        while item is not None:
+            failed = failed or "error" in item
+            try:
+                line = dumps_json(item, indent=False)
+            except TypeError as e:
+                logger.critical("Failed to serialize results to JSON: %s. Results structure issue?", e, exc_info=True)
+                print(f"Output Error: Could not format results as JSON - {e}", file=sys.stderr)
+                sys.exit(1)
+            try:
+                sys.stdout.buffer.write(line + b"\n")
+                sys.stdout.buffer.flush()
+            except BrokenPipeError:
+                # The reader went away (e.g. piped into `head`). Stop without a
+                # traceback; stdout is pointed at devnull so the interpreter's final
+                # flush does not fail again.
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+                sys.exit(1)
+            try:
+                item = next(items, None)
+            except Exception as e:
+                print(f"Operation failed: {_file_error(args.batch, e)['error']}", file=sys.stderr)
+                sys.exit(1)
+        sys.exit(1 if failed else 0)
+    elif args.batch:
+        logger.info("Initiating batch analysis for file input: %s", args.batch)
+        results = analyzer.analyze_batch_file(
+            args.batch,
+            sentence_level=args.sentence_level,
+            include_noun_phrases=args.noun_phrases,
+            detect_language=args.detect_lang
+        )
 
     # --- Present Results ---
     if results is None:
@@ -334,11 +1558,14 @@ def main():
         print(f"Operation failed: {results['error']}", file=sys.stderr)
         sys.exit(1) # Exit with a non-zero status to indicate failure.
 
-    if args.json:
+    if args.json or args.ndjson:
         # Output in JSON format for easy parsing by other systems.
         logger.info("Outputting results in JSON format.")
         try:
-            print(json.dumps(results, indent=4, ensure_ascii=False)) # ensure_ascii=False for better human readability of non-ASCII chars in output
+            output = dumps_json(results, indent=not args.ndjson)
+            # Write the encoded bytes directly, bypassing the text layer.
+            sys.stdout.flush()
+            sys.stdout.buffer.write(output + b"\n")
         except TypeError as e:
             logger.critical("Failed to serialize results to JSON: %s. Results structure issue?", e, exc_info=True)
             print(f"Output Error: Could not format results as JSON - {e}", file=sys.stderr)
@@ -346,55 +1573,12 @@ def main():
     else:
         # Output in human-readable plain text format.
         logger.info("Outputting results in plain text format.")
-        print("\n--- Sentiment and Text Analysis Results ---")
-
-        # Display core sentiment and stats
-        if 'overall' in results:
-            overall = results['overall']
-            print("Overall Analysis:")
-            print(f"  Polarity:         {overall['polarity']:.4f}")
-            print(f"  Subjectivity:     {overall['subjectivity']:.4f}")
-            print(f"  Classification:   {overall['classification']}")
-
-        if 'text_stats' in results:
-             stats = results['text_stats']
-             print("Text Statistics:")
-             print(f"  Word Count:       {stats['word_count']}")
-             print(f"  Sentence Count:   {stats['sentence_count']}")
-
-        if 'detected_language' in results:
-            print(f"Detected Language:  {results['detected_language']}")
-        elif 'detected_language_error' in results:
-             print(f"Language Detection: Failed - {results['detected_language_error']}")
-
-
-        if 'noun_phrases' in results and results['noun_phrases']:
-            # List extracted noun phrases if found.
-            print("\nKey Noun Phrases:")
-            # Limit display of noun phrases for brevity in plain text
-            display_phrases = results['noun_phrases'][:10] # Show first 10
-            print(f"  {', '.join(display_phrases)}{'...' if len(results['noun_phrases']) > 10 else ''}")
-
-
-        if 'sentences' in results:
-            # If sentence-level analysis was requested, list results for each.
-            print("\nSentence-Level Analysis:")
-            for i, sentence_result in enumerate(results['sentences']):
-                 if 'error' in sentence_result:
-                     print(f"  Sentence {i+1}: Analysis Failed - {sentence_result['error']}")
-                     continue # Skip to next sentence if analysis failed for this one
-
-                 # Ellipsize long sentences for readability in the output.
-                 display_text = sentence_result['text'] if len(sentence_result['text']) < 80 else sentence_result['text'][:77] + "..."
-                 print(f"  Sentence {i+1}: \"{display_text}\"")
-                 print(f"    Polarity:       {sentence_result['polarity']:.4f}")
-                 print(f"    Subjectivity:   {sentence_result['subjectivity']:.4f}")
-                 print(f"    Classification: {sentence_result['classification']}")
-
-        # Display processing time
-        if 'processing_time_seconds' in results:
-             print(f"\nProcessing Time:  {results['processing_time_seconds']:.4f} seconds")
-
+        items = results['results'] if args.batch else [results]
+        for item in items:
+            if 'error' in item:
+                print(f"Operation failed: {item['error']}", file=sys.stderr)
+                continue
+            print_text_results(item)
 
         print("---------------------------------------------")
         # A concluding note on the nature of the scores.
@@ -403,6 +1587,10 @@ def main():
         print("  Subjectivity: 0.0 (Objective) to +1.0 (Subjective).")
         print(f"  Classification based on thresholds: >={args.pos_threshold} (Positive), <={args.neg_threshold} (Negative), else Neutral.")
 
+    if args.batch and any('error' in item for item in results['results']):
+        # Signal partial failure of a batch run after all output has been written.
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     # Ensure the script runs when executed directly.
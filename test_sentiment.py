@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# ©2025 umogal
+"""
+Regression tests for the vectorized lexicon scorer.
+
+The fast scorer must give the same scores as pattern's own analyzer (which
+TextBlob's default backend uses) for any text without "!" boosts, emoticons or
+short abbreviations, the documented differences. Run with:
+
+    python -m unittest test_sentiment
+"""
+import random
+import unittest
+
+from textblob.en import sentiment as pattern_sentiment
+
+import sentiment
+
+# Tokens that exercise the negation/modifier scopes and the tokenizer.
+EXTRA_TOKENS = ("not", "no", "never", "isn't", "don't", "it's", "a", "s", "x", "ab",
+                "the", "movie", ",", ";", "(", "...", "-", "3.14", "“", "”", "'",
+                "very", "really", "first-rate")
+
+
+class FastScorerParityTest(unittest.TestCase):
+
+    def assertSameScores(self, text):
+        expected = tuple(pattern_sentiment(text))[:2]
+        actual = sentiment._score_tokens(sentiment._tokenize(text))
+        self.assertAlmostEqual(actual[0], expected[0], places=9, msg=text)
+        self.assertAlmostEqual(actual[1], expected[1], places=9, msg=text)
+
+    def test_known_phrases(self):
+        for text in ("This is not a good idea",
+                     "not a bad movie",
+                     "never a great time",
+                     "The food was not very good",
+                     "it's not very very good",
+                     "really not good",
+                     "It isn't good",
+                     "A first-rate, well-intentioned effort",
+                     "The support is top-notch",
+                     "Great product",
+                     "not... good"):
+            self.assertSameScores(text)
+
+    def test_random_lexicon_sequences(self):
+        lexicon = sorted(sentiment._get_lexicon_arrays()[0])
+        rnd = random.Random(0)
+        for _ in range(3000):
+            words = [rnd.choice(lexicon) if rnd.random() < 0.5 else rnd.choice(EXTRA_TOKENS)
+                     for _ in range(rnd.randint(1, 15))]
+            self.assertSameScores(" ".join(words))
+
+    def test_fast_paths_agree_on_text_stats(self):
+        analyzer = sentiment.SentimentAnalyzer(backend="fast")
+        for text in ("Pi is 3.14 and good", "Hello. World", "Wow!!! Great?! ok", "Not... good"):
+            self.assertEqual(analyzer.analyze_text(text)["text_stats"],
+                             analyzer.analyze_text_fast(text)["text_stats"], msg=text)
+
+
+if __name__ == "__main__":
+    unittest.main()